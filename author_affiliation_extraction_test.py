@@ -2,41 +2,29 @@
 import pandas as pd
 import re
 
-file_path = "285scopus_wearables_ai_education_corpus.csv"
-
-for enc in ["utf-8", "latin1"]:
-    try:
-        df = pd.read_csv(file_path, encoding=enc)
-        print(f"Loaded with {enc}")
-        break
-    except:
-        continue
+FILE_PATH = "285scopus_wearables_ai_education_corpus.csv"
+OUTPUT_FILE = "key_authors_preliminary.csv"
 
 AUTHOR_COL = "Author full names"
 AFFIL_COL = "Authors with affiliations"
 
-if AUTHOR_COL not in df.columns or AFFIL_COL not in df.columns:
-    raise ValueError("The file does not contain expected columns.")
+
+def load_corpus(file_path=FILE_PATH):
+    for enc in ["utf-8", "latin1"]:
+        try:
+            df = pd.read_csv(file_path, encoding=enc)
+            print(f"Loaded with {enc}")
+            return df
+        except Exception:
+            continue
+    raise ValueError("Could not read the CSV file.")
+
 
 def split_authors(text):
     if not isinstance(text, str):
         return []
     return [a.strip() for a in re.split(r'[;,]', text) if len(a.strip()) > 2]
 
-df["Author_List"] = df[AUTHOR_COL].apply(split_authors)
-
-author_counts = {}
-
-for authors in df["Author_List"]:
-    for a in authors:
-        author_counts[a] = author_counts.get(a, 0) + 1
-
-author_counts_df = (
-    pd.DataFrame.from_dict(author_counts, orient="index", columns=["Publications"])
-    .sort_values("Publications", ascending=False)
-)
-
-top_authors = author_counts_df.head(20).copy()
 
 def extract_affiliation(author, affil_text):
     """Return affiliation that contains the author's name."""
@@ -50,21 +38,48 @@ def extract_affiliation(author, affil_text):
     return ""
 
 
-affiliation_map = {}
+def key_authors(df, topn=20):
+    if AUTHOR_COL not in df.columns or AFFIL_COL not in df.columns:
+        raise ValueError("The file does not contain expected columns.")
+
+    df["Author_List"] = df[AUTHOR_COL].apply(split_authors)
+
+    author_counts = {}
+
+    for authors in df["Author_List"]:
+        for a in authors:
+            author_counts[a] = author_counts.get(a, 0) + 1
+
+    author_counts_df = (
+        pd.DataFrame.from_dict(author_counts, orient="index", columns=["Publications"])
+        .sort_values("Publications", ascending=False)
+    )
+
+    top_authors = author_counts_df.head(topn).copy()
+
+    affiliation_map = {}
+
+    for _, row in df.iterrows():
+        affil_text = row[AFFIL_COL]
+        authors = row["Author_List"]
+        for a in authors:
+            if a not in affiliation_map:
+                affil = extract_affiliation(a, affil_text)
+                if affil:
+                    affiliation_map[a] = affil
+
+    top_authors["Affiliation"] = top_authors.index.map(lambda x: affiliation_map.get(x, ""))
+    return top_authors
+
 
-for _, row in df.iterrows():
-    affil_text = row[AFFIL_COL]
-    authors = row["Author_List"]
-    for a in authors:
-        if a not in affiliation_map:
-            affil = extract_affiliation(a, affil_text)
-            if affil:
-                affiliation_map[a] = affil
+def main(file_path=FILE_PATH, output_file=OUTPUT_FILE, topn=20):
+    df = load_corpus(file_path)
+    top_authors = key_authors(df, topn=topn)
+    top_authors.to_csv(output_file)
 
-top_authors["Affiliation"] = top_authors.index.map(lambda x: affiliation_map.get(x, ""))
+    print(f"\nSaved {output_file}")
+    print(top_authors)
 
-output_file = "key_authors_preliminary.csv"
-top_authors.to_csv(output_file)
 
-print(f"\nSaved {output_file}")
-print(top_authors)
+if __name__ == "__main__":
+    main()
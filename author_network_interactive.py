@@ -1,23 +1,25 @@
 # File name: author.py
 import pandas as pd
-import networkx as nx
-import matplotlib.pyplot as plt
 from itertools import combinations
 from collections import Counter
-from networkx.algorithms.community import greedy_modularity_communities
 
 FILE_PATH = "285scopus_wearables_ai_education_corpus.csv"
 AUTHOR_COLUMN = "Authors"
 
-df = pd.read_csv(FILE_PATH)
 
-author_counts = Counter()
+def count_author_publications(df):
+    author_counts = Counter()
 
-for authors in df[AUTHOR_COLUMN].dropna():
-    for author in authors.split(";"):
-        author_counts[author.strip()] += 1
+    for authors in df[AUTHOR_COLUMN].dropna():
+        for author in authors.split(";"):
+            author_counts[author.strip()] += 1
+
+    return author_counts
+
+
+def build_author_graph(df, author_counts, min_pubs):
+    import networkx as nx
 
-def build_author_graph(min_pubs):
     G = nx.Graph()
 
     for authors in df[AUTHOR_COLUMN].dropna():
@@ -37,7 +39,12 @@ def build_author_graph(min_pubs):
 
     return G
 
+
 def visualize_graph(G, title, node_scale=20, label_size=7):
+    import matplotlib.pyplot as plt
+    import networkx as nx
+    from networkx.algorithms.community import greedy_modularity_communities
+
     if G.number_of_nodes() == 0:
         print(f"No authors found for {title}")
         return
@@ -71,31 +78,42 @@ def visualize_graph(G, title, node_scale=20, label_size=7):
     plt.axis("off")
     plt.show()
 
-for min_pubs in [1, 2, 3]:
-    print(f"\n=== Minimum publications: {min_pubs} ===")
 
-    G = build_author_graph(min_pubs)
+def main(file_path=FILE_PATH, min_pubs_levels=(1, 2, 3)):
+    import networkx as nx
 
-    print(f"Authors: {G.number_of_nodes()}")
-    print(f"Co-author links: {G.number_of_edges()}")
+    df = pd.read_csv(file_path)
+    author_counts = count_author_publications(df)
 
-    visualize_graph(
-        G,
-        title=f"Author Network (All Authors, Minimum Publications ≥ {min_pubs})",
-        node_scale=30,
-        label_size=7
-    )
+    for min_pubs in min_pubs_levels:
+        print(f"\n=== Minimum publications: {min_pubs} ===")
+
+        G = build_author_graph(df, author_counts, min_pubs)
 
-    if G.number_of_nodes() > 0:
-        largest_cc = max(nx.connected_components(G), key=len)
-        G_largest = G.subgraph(largest_cc).copy()
+        print(f"Authors: {G.number_of_nodes()}")
+        print(f"Co-author links: {G.number_of_edges()}")
 
         visualize_graph(
-            G_largest,
-            title=(
-                "Author Network (Largest Connected Component, "
-                f"Minimum Publications ≥ {min_pubs})"
-            ),
-            node_scale=40,
-            label_size=8
+            G,
+            title=f"Author Network (All Authors, Minimum Publications ≥ {min_pubs})",
+            node_scale=30,
+            label_size=7
         )
+
+        if G.number_of_nodes() > 0:
+            largest_cc = max(nx.connected_components(G), key=len)
+            G_largest = G.subgraph(largest_cc).copy()
+
+            visualize_graph(
+                G_largest,
+                title=(
+                    "Author Network (Largest Connected Component, "
+                    f"Minimum Publications ≥ {min_pubs})"
+                ),
+                node_scale=40,
+                label_size=8
+            )
+
+
+if __name__ == "__main__":
+    main()
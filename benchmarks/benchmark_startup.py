@@ -0,0 +1,79 @@
+# File name: benchmark_startup.py
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(ROOT, "bibliometrics_cli.py")
+CORPUS = os.path.join(ROOT, "285scopus_wearables_ai_education_corpus.csv")
+
+# Each case is run in a fresh interpreter inside a scratch directory, so the
+# timings include imports and the repository's saved outputs are untouched.
+CASES = [
+    ("python (empty interpreter)", ["-c", "pass"]),
+    ("eager heavy imports (old scripts)", ["-c", "import pandas, matplotlib.pyplot, networkx, community"]),
+    ("cli --help", [CLI, "--help"]),
+    ("cli top authors --topn 20", [CLI, "--corpus", CORPUS, "top", "authors", "--topn", "20"]),
+    ("cli top journals", [CLI, "--corpus", CORPUS, "top", "journals"]),
+    ("cli key-authors", [CLI, "--corpus", CORPUS, "key-authors"]),
+]
+
+IMPORT_MODULES = [
+    "scopus_bibliometric_overview",
+    "exploratory_bibliometric_checks",
+    "citation_impact_metrics",
+    "country_extraction",
+    "author_affiliation_extraction_test",
+    "build_keyword_cooccurrence_network",
+    "visualize_keyword_network",
+    "extract_keyword_clusters",
+    "author_network_interactive",
+    "organization_network_interactive",
+    "scopus_api_harvester",
+]
+
+HEAVY_MODULES = ["matplotlib", "networkx", "community"]
+
+
+def time_run(args, repeat, cwd):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=cwd, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return min(timings), statistics.median(timings)
+
+
+def heavy_modules_loaded(module):
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True,
+                            capture_output=True, text=True)
+    return result.stdout.strip() or "-"
+
+
+def main(repeat=5):
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    os.environ["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")]))
+
+    print(f"Startup benchmark ({repeat} runs each)\n")
+    with tempfile.TemporaryDirectory() as scratch:
+        print(f"{'Command':<45}{'min (s)':>10}{'median (s)':>12}")
+        for name, args in CASES:
+            best, median = time_run(args, repeat, scratch)
+            print(f"{name:<45}{best:>10.3f}{median:>12.3f}")
+
+        print(f"\n{'Import':<45}{'min (s)':>10}{'median (s)':>12}  heavy deps loaded")
+        for module in IMPORT_MODULES:
+            best, median = time_run(["-c", f"import {module}"], repeat, scratch)
+            print(f"{module:<45}{best:>10.3f}{median:>12.3f}  {heavy_modules_loaded(module)}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,173 @@
+# File name: bibliometrics_cli.py
+import argparse
+import os
+
+CORPUS = "285scopus_wearables_ai_education_corpus.csv"
+KEYWORD_FILE = "manual_seed_papers_keywords.csv"
+KEYWORD_EDGES = "keyword_network_edges.csv"
+OUTDIR = "analysis_results"
+
+TOP_TABLES = ["years", "journals", "authors", "institutions", "countries"]
+
+# Analysis modules are imported inside each handler so that a subcommand only
+# pays for the libraries it actually uses.
+
+
+def run_overview(args):
+    from scopus_bibliometric_overview import main
+    main(args.corpus, args.outdir)
+
+
+def run_checks(args):
+    from exploratory_bibliometric_checks import main
+    main(args.corpus, args.outdir, plot=not args.no_plot)
+
+
+def run_top(args):
+    import exploratory_bibliometric_checks as checks
+
+    os.makedirs(args.outdir, exist_ok=True)
+    df = checks.load_corpus(args.corpus)
+    if args.table == "years":
+        checks.papers_by_year(df, args.outdir, plot=args.plot)
+        return
+
+    analysis = {
+        "journals": checks.top_journals,
+        "authors": checks.top_authors,
+        "institutions": checks.top_institutions,
+        "countries": checks.top_countries,
+    }[args.table]
+    kwargs = {"topn": args.topn} if args.topn is not None else {}
+    analysis(df, args.outdir, plot=args.plot, **kwargs)
+
+
+def run_citations(args):
+    from citation_impact_metrics import main
+    main(args.corpus, args.outdir, args.merge_into)
+
+
+def run_countries(args):
+    from country_extraction import main
+    main(args.corpus, args.outdir)
+
+
+def run_key_authors(args):
+    from author_affiliation_extraction_test import OUTPUT_FILE, main
+    os.makedirs(args.outdir, exist_ok=True)
+    main(args.corpus, os.path.join(args.outdir, OUTPUT_FILE), topn=args.topn)
+
+
+def keyword_edges(args):
+    return args.edges or os.path.join(args.outdir, KEYWORD_EDGES)
+
+
+def run_keyword_network(args):
+    from build_keyword_cooccurrence_network import main
+    os.makedirs(args.outdir, exist_ok=True)
+    main(args.keywords, keyword_edges(args), plot=not args.no_plot)
+
+
+def run_keyword_graph(args):
+    from visualize_keyword_network import OUTPUT_PNG, main
+    os.makedirs(args.outdir, exist_ok=True)
+    main(keyword_edges(args), os.path.join(args.outdir, OUTPUT_PNG), show=not args.no_show)
+
+
+def run_keyword_clusters(args):
+    from extract_keyword_clusters import main
+    main(keyword_edges(args))
+
+
+def run_author_network(args):
+    from author_network_interactive import main
+    main(args.corpus, args.min_pubs)
+
+
+def run_org_network(args):
+    from organization_network_interactive import main
+    main(args.corpus, args.min_pubs)
+
+
+def run_harvest(args):
+    from scopus_api_harvester import main
+    main(args.harvest_args)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="bibliometrics_cli.py",
+        description="Bibliometric analyses for the wearables, AI and education corpus.",
+    )
+    parser.add_argument("--corpus", default=CORPUS, help="Scopus export CSV")
+    parser.add_argument("--outdir", default=OUTDIR, help="Directory every subcommand writes its outputs to")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sub = subparsers.add_parser("overview", help="Year, journal and author summaries with plots")
+    sub.set_defaults(func=run_overview)
+
+    sub = subparsers.add_parser("checks", help="Exploratory checks (years, journals, authors, institutions, countries)")
+    sub.add_argument("--no-plot", action="store_true")
+    sub.set_defaults(func=run_checks)
+
+    sub = subparsers.add_parser("top", help="Print and save a single top-N table")
+    sub.add_argument("table", choices=TOP_TABLES)
+    sub.add_argument("--topn", type=int)
+    sub.add_argument("--plot", action="store_true")
+    sub.set_defaults(func=run_top)
+
+    sub = subparsers.add_parser("citations", help="h-index, g-index and citation totals per entity")
+    sub.add_argument("--merge-into", help="Accumulated citation table (pickle) to merge the corpus into; "
+                                          "metrics then cover every export merged so far")
+    sub.set_defaults(func=run_citations)
+
+    sub = subparsers.add_parser("countries", help="Country extraction and collaboration network")
+    sub.set_defaults(func=run_countries)
+
+    sub = subparsers.add_parser("key-authors", help="Top authors with their affiliations")
+    sub.add_argument("--topn", type=int, default=20)
+    sub.set_defaults(func=run_key_authors)
+
+    sub = subparsers.add_parser("keyword-network", help="Build the keyword co-occurrence network")
+    sub.add_argument("--keywords", default=KEYWORD_FILE)
+    sub.add_argument("--edges", help=f"Keyword edge list (default: <outdir>/{KEYWORD_EDGES})")
+    sub.add_argument("--no-plot", action="store_true")
+    sub.set_defaults(func=run_keyword_network)
+
+    sub = subparsers.add_parser("keyword-graph", help="Plot keyword communities from the edge list")
+    sub.add_argument("--edges", help=f"Keyword edge list (default: <outdir>/{KEYWORD_EDGES})")
+    sub.add_argument("--no-show", action="store_true")
+    sub.set_defaults(func=run_keyword_graph)
+
+    sub = subparsers.add_parser("keyword-clusters", help="Print top keyword pairs and clusters")
+    sub.add_argument("--edges", help=f"Keyword edge list (default: <outdir>/{KEYWORD_EDGES})")
+    sub.set_defaults(func=run_keyword_clusters)
+
+    sub = subparsers.add_parser("author-network", help="Interactive co-author network")
+    sub.add_argument("--min-pubs", type=int, nargs="+", default=[1, 2, 3])
+    sub.set_defaults(func=run_author_network)
+
+    sub = subparsers.add_parser("org-network", help="Interactive organization network")
+    sub.add_argument("--min-pubs", type=int, nargs="+", default=[1, 2, 3])
+    sub.set_defaults(func=run_org_network)
+
+    # Everything after "harvest" is handed to the harvester's own parser.
+    sub = subparsers.add_parser("harvest", add_help=False,
+                                help="Harvest the Scopus API (see harvest --help)")
+    sub.set_defaults(func=run_harvest)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if args.command == "harvest":
+        args.harvest_args = extra
+    elif extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+# File name: citation_impact_metrics.py
+import argparse
+import os
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+PAPER_COLUMN = "EID"
+CITED_BY_COLUMN = "Cited by"
+YEAR_COLUMN = "Year"
+
+ENTITY_COLUMNS = {
+    "author": ["Author(s) ID"],
+    "organization": ["Affiliations"],
+    "source": ["Source title"],
+    "keyword": ["Author Keywords", "Index Keywords"],
+}
+
+TABLE_COLUMNS = ["kind", "entity", "paper", "cited_by", "year"]
+METRIC_COLUMNS = [
+    "Papers",
+    "Total Citations",
+    "Mean Citations",
+    "h-index",
+    "g-index",
+    "Citations per Year",
+]
+
+
+def _paper_frame(df):
+    paper = df[PAPER_COLUMN] if PAPER_COLUMN in df.columns else df.index.to_series()
+    cited = df[CITED_BY_COLUMN] if CITED_BY_COLUMN in df.columns else 0
+    year = df[YEAR_COLUMN] if YEAR_COLUMN in df.columns else pd.NA
+    return pd.DataFrame({
+        "paper": paper.astype(str),
+        "cited_by": pd.to_numeric(cited, errors="coerce"),
+        "year": pd.to_numeric(year, errors="coerce"),
+    }, index=df.index).fillna({"cited_by": 0})
+
+
+def explode_entities(df, kind):
+    """Return one row per (entity, paper) for a single entity kind."""
+    papers = _paper_frame(df)
+    columns = [c for c in ENTITY_COLUMNS[kind] if c in df.columns]
+    if not columns:
+        return pd.DataFrame(columns=TABLE_COLUMNS)
+
+    if kind == "source":
+        values = df[columns[0]].astype("string").str.strip()
+    else:
+        values = (
+            df[columns]
+            .astype("string")
+            .apply(lambda s: s.str.split(";"))
+            .stack()
+            .explode()
+            .str.strip()
+            .droplevel(-1)
+        )
+        if kind == "keyword":
+            values = values.str.lower()
+
+    values = values.dropna()
+    values = values[values.str.len() > 0]
+    table = papers.loc[values.index].assign(kind=kind, entity=values.to_numpy())
+    return table[TABLE_COLUMNS].drop_duplicates(["kind", "entity", "paper"])
+
+
+def build_citation_table(df):
+    return pd.concat(
+        [explode_entities(df, kind) for kind in ENTITY_COLUMNS], ignore_index=True
+    )
+
+
+def update_citation_table(table_path, df):
+    """Merge an export into an accumulated citation table stored at `table_path`.
+
+    Only papers whose EID is not in the table yet are exploded. Papers that
+    are already there keep their entity rows and just get `Cited by` and the
+    year refreshed from the export. Exports without an EID column are refused,
+    because their row-number paper IDs would collide with other exports.
+    """
+    if PAPER_COLUMN not in df.columns:
+        raise ValueError(f"Cannot merge an export without an '{PAPER_COLUMN}' column into {table_path}.")
+
+    if not os.path.exists(table_path):
+        table = build_citation_table(df)
+    else:
+        table = pd.read_pickle(table_path)
+        papers = _paper_frame(df).drop_duplicates("paper", keep="last").set_index("paper")
+
+        known = table["paper"].isin(papers.index)
+        table.loc[known, "cited_by"] = table.loc[known, "paper"].map(papers["cited_by"]).to_numpy()
+        table.loc[known, "year"] = table.loc[known, "paper"].map(papers["year"]).to_numpy()
+
+        is_new = ~df[PAPER_COLUMN].astype(str).isin(pd.Index(table["paper"].unique()))
+        table = pd.concat([table, build_citation_table(df[is_new])], ignore_index=True)
+
+    table.to_pickle(table_path)
+    return table
+
+
+def citation_metrics(table, current_year=None):
+    """Per-entity citation impact, computed over contiguous sorted segments."""
+    current_year = current_year or date.today().year
+    keys = ["kind", "entity"]
+    if table.empty:
+        return pd.DataFrame(
+            columns=METRIC_COLUMNS,
+            index=pd.MultiIndex.from_arrays([[], []], names=keys),
+        )
+
+    cited = table["cited_by"].to_numpy(dtype="int64")
+    years = table["year"].to_numpy(dtype="float64")
+    codes = table.groupby(keys, sort=False).ngroup().to_numpy()
+    order = np.lexsort((-cited, codes))
+    codes, cited, years = codes[order], cited[order], years[order]
+
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    sizes = np.diff(np.r_[starts, len(codes)])
+    rank = np.arange(1, len(codes) + 1) - np.repeat(starts, sizes)
+    running = np.cumsum(cited)
+    cumulative = running - np.repeat(running[starts] - cited[starts], sizes)
+
+    total = np.add.reduceat(cited, starts)
+    h_index = np.maximum.reduceat(np.where(cited >= rank, rank, 0), starts)
+    g_index = np.maximum.reduceat(np.where(cumulative >= rank ** 2, rank, 0), starts)
+    first_year = np.fmin.reduceat(years, starts)
+    years_active = np.clip(current_year - first_year + 1, 1, None)
+
+    index = pd.MultiIndex.from_frame(table[keys].iloc[order[starts]])
+    return pd.DataFrame({
+        "Papers": sizes,
+        "Total Citations": total,
+        "Mean Citations": (total / sizes).round(2),
+        "h-index": h_index,
+        "g-index": g_index,
+        "Citations per Year": (total / years_active).round(2),
+    }, index=index).sort_index()
+
+
+def metrics_for(metrics, kind):
+    if metrics is None or kind not in metrics.index.get_level_values("kind"):
+        return pd.DataFrame(columns=METRIC_COLUMNS)
+    return metrics.xs(kind, level="kind")
+
+
+def main(file_path="285scopus_wearables_ai_education_corpus.csv", outdir="analysis_results",
+         table_path=None):
+    os.makedirs(outdir, exist_ok=True)
+
+    df = pd.read_csv(file_path)
+    if table_path:
+        table = update_citation_table(table_path, df)
+        print(f"Merged {file_path} into {table_path} ({table['paper'].nunique()} papers)")
+    else:
+        table = build_citation_table(df)
+    metrics = citation_metrics(table)
+
+    for kind in ENTITY_COLUMNS:
+        out = metrics_for(metrics, kind).sort_values(
+            ["h-index", "Total Citations"], ascending=False
+        )
+        out.to_csv(os.path.join(outdir, f"citation_impact_{kind}.csv"), index_label=kind.title())
+        print(f"\nTop {kind}s by h-index:\n", out.head(10))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Citation impact metrics per author, organization, source and keyword.")
+    parser.add_argument("corpus", nargs="?", default="285scopus_wearables_ai_education_corpus.csv")
+    parser.add_argument("--outdir", default="analysis_results")
+    parser.add_argument("--merge-into", dest="table_path",
+                        help="Accumulated citation table (pickle) to merge this export into; "
+                             "metrics then cover every export merged so far")
+    args = parser.parse_args()
+    main(args.corpus, args.outdir, args.table_path)
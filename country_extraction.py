@@ -0,0 +1,165 @@
+# File name: country_extraction.py
+import csv
+import os
+from collections import deque
+
+import pandas as pd
+
+from pair_counting import count_pairs
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "country_gazetteer.csv")
+AFFILIATION_COLUMNS = ["Affiliations", "Authors with affiliations"]
+
+
+def load_gazetteer(path=GAZETTEER_PATH):
+    with open(path, encoding="utf-8", newline="") as f:
+        return {row["Alias"].lower(): row["Country"] for row in csv.DictReader(f)}
+
+
+def build_matcher(gazetteer):
+    """Compile the aliases into an Aho-Corasick automaton.
+
+    Returns (goto, fail, output) where output[state] lists the (length, country)
+    pairs recognised at that state, longest alias first.
+    """
+    goto, fail, output = [{}], [0], [[]]
+
+    for alias, country in gazetteer.items():
+        state = 0
+        for ch in alias:
+            if ch not in goto[state]:
+                goto.append({})
+                fail.append(0)
+                output.append([])
+                goto[state][ch] = len(goto) - 1
+            state = goto[state][ch]
+        output[state].append((len(alias), country))
+
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for ch, nxt in goto[state].items():
+            queue.append(nxt)
+            fallback = fail[state]
+            while fallback and ch not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[nxt] = goto[fallback].get(ch, 0) if state else 0
+            output[nxt] = sorted(output[nxt] + output[fail[nxt]], reverse=True)
+
+    return goto, fail, output
+
+
+def find_countries(text, matcher):
+    """Return the set of countries named in a ';'-separated affiliation string.
+
+    Scopus puts the country last in each affiliation, so within a segment the
+    rightmost (then longest) match wins; this keeps "Georgia" in
+    "University of Georgia, Athens, GA, United States" from being counted.
+    """
+    goto, fail, output = matcher
+    text = text.lower()
+    countries = set()
+    state, best = 0, None
+
+    for end, ch in enumerate(text, start=1):
+        if ch == ";":
+            if best:
+                countries.add(best)
+            state, best = 0, None
+            continue
+
+        while state and ch not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(ch, 0)
+
+        for length, country in output[state]:
+            start = end - length
+            if start > 0 and text[start - 1].isalnum():
+                continue
+            if end < len(text) and text[end].isalnum():
+                continue
+            best = country
+            break
+
+    if best:
+        countries.add(best)
+    return countries
+
+
+def extract_countries(df, matcher=None):
+    """Per-paper sorted country lists, read from the affiliation strings."""
+    matcher = matcher or build_matcher(load_gazetteer())
+    columns = [c for c in AFFILIATION_COLUMNS if c in df.columns]
+    if not columns:
+        return pd.Series([[] for _ in range(len(df))], index=df.index, dtype=object)
+
+    text = df[columns[0]]
+    for col in columns[1:]:
+        text = text.fillna(df[col])
+
+    return text.map(
+        lambda t: sorted(find_countries(t, matcher)) if isinstance(t, str) else []
+    )
+
+
+def top_countries(paper_countries, topn=15):
+    exploded = paper_countries.explode().dropna()
+    international = paper_countries.str.len() > 1
+    summary = pd.DataFrame({
+        "Papers": exploded.value_counts(),
+        "International Papers": exploded[international.loc[exploded.index]].value_counts(),
+    }).fillna(0).astype(int)
+    summary.index.name = "Country"
+    return summary.sort_values(["Papers", "International Papers"], ascending=False).head(topn)
+
+
+def country_collaboration_edges(paper_countries, min_weight=1):
+    edges = count_pairs(paper_countries, min_weight=min_weight)
+    return edges.rename(columns={"item_1": "Country_1", "item_2": "Country_2", "weight": "Weight"})
+
+
+def plot_country_network(edge_df, outdir):
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
+    G = nx.Graph()
+    for _, row in edge_df.iterrows():
+        G.add_edge(row["Country_1"], row["Country_2"], weight=row["Weight"])
+
+    plt.figure(figsize=(12, 10))
+    pos = nx.spring_layout(G, k=0.5, seed=42)
+
+    weights = [d["weight"] for _, _, d in G.edges(data=True)]
+    sizes = [G.degree(n, weight="weight") * 60 + 100 for n in G.nodes()]
+    nx.draw_networkx_nodes(G, pos, node_size=sizes, node_color="violet", alpha=0.9)
+    nx.draw_networkx_edges(G, pos, width=[w * 0.8 for w in weights], alpha=0.5)
+    nx.draw_networkx_labels(G, pos, font_size=8)
+
+    plt.title("International Collaboration Network")
+    plt.axis("off")
+    plt.tight_layout()
+    plt.savefig(os.path.join(outdir, "country_collaboration_network.png"), dpi=200)
+    plt.close()
+
+
+def main(file_path="285scopus_wearables_ai_education_corpus.csv", outdir="analysis_results"):
+    os.makedirs(outdir, exist_ok=True)
+
+    df = pd.read_csv(file_path)
+    paper_countries = extract_countries(df)
+
+    summary = top_countries(paper_countries)
+    summary.to_csv(os.path.join(outdir, "top_countries.csv"))
+    print("\nTop Countries:\n", summary)
+
+    edge_df = country_collaboration_edges(paper_countries)
+    edge_df.to_csv(os.path.join(outdir, "country_collaboration_edges.csv"), index=False)
+    print(f"\nInternational collaborations: {len(edge_df)} country pairs")
+
+    if not edge_df.empty:
+        plot_country_network(edge_df, outdir)
+        print("Saved country collaboration network (CSV + PNG)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,50 +1,75 @@
 # File name: interactiveanalysis.py
 import pandas as pd
-import matplotlib.pyplot as plt
 import os
 
-file_path = "285scopus_wearables_ai_education_corpus.csv"
-outdir = "analysis_results"
-os.makedirs(outdir, exist_ok=True)
+from citation_impact_metrics import citation_metrics, explode_entities, metrics_for
+from country_extraction import extract_countries, top_countries as country_summary
 
-try:
-    df = pd.read_csv(file_path, encoding="utf-8")
-except UnicodeDecodeError:
-    df = pd.read_csv(file_path, encoding="latin1")
+FILE_PATH = "285scopus_wearables_ai_education_corpus.csv"
+OUTDIR = "analysis_results"
 
-print(f"Loaded {file_path} with columns:\n{list(df.columns)}")
 
-if "Year" in df.columns:
+def load_corpus(file_path=FILE_PATH):
+    try:
+        return pd.read_csv(file_path, encoding="utf-8")
+    except UnicodeDecodeError:
+        return pd.read_csv(file_path, encoding="latin1")
+
+
+def show_plot(counts, kind, figsize, color, title):
+    import matplotlib.pyplot as plt
+
+    counts.plot(kind=kind, figsize=figsize, color=color, title=title)
+    plt.tight_layout()
+    plt.show()
+
+
+def papers_by_year(df, outdir, plot=True):
+    if "Year" not in df.columns:
+        print("'Year' column not found in CSV.")
+        return None
+
     df["Year"] = pd.to_numeric(df["Year"], errors="coerce")
     year_counts = df["Year"].value_counts().sort_index()
-    if not year_counts.empty:
-        print("\nPapers by Year:\n", year_counts)
-        year_counts.to_csv(os.path.join(outdir, "papers_by_year.csv"))
-        year_counts.plot(kind="bar", figsize=(8, 5), color="skyblue", title="Papers by Year")
-        plt.tight_layout()
-        plt.show()
-    else:
+    if year_counts.empty:
         print("No valid year data found.")
-else:
-    print("'Year' column not found in CSV.")
+        return None
 
-journal_col = None
-for c in df.columns:
-    if "source" in c.lower() or "journal" in c.lower():
-        journal_col = c
-        break
+    print("\nPapers by Year:\n", year_counts)
+    year_counts.to_csv(os.path.join(outdir, "papers_by_year.csv"))
+    if plot:
+        show_plot(year_counts, "bar", (8, 5), "skyblue", "Papers by Year")
+    return year_counts
 
-if journal_col:
-    top_journals = df[journal_col].dropna().value_counts().head(15)
+
+def top_journals(df, outdir, topn=15, plot=True):
+    journal_col = None
+    for c in df.columns:
+        if "source" in c.lower() or "journal" in c.lower():
+            journal_col = c
+            break
+
+    if not journal_col:
+        print("No journal/source column found.")
+        return None
+
+    top_journals = df[journal_col].dropna().value_counts().head(topn)
     print("\nTop Journals:\n", top_journals)
-    top_journals.to_csv(os.path.join(outdir, "top_journals.csv"), header=["Count"])
-    top_journals.sort_values().plot(kind="barh", figsize=(8, 5), color="coral", title="Top Journals")
-    plt.tight_layout()
-    plt.show()
-else:
-    print("No journal/source column found.")
+    journal_metrics = metrics_for(citation_metrics(explode_entities(df, "source")), "source")
+    journal_summary = top_journals.rename("Count").to_frame().join(
+        journal_metrics.drop(columns="Papers")
+    )
+    journal_summary.to_csv(os.path.join(outdir, "top_journals.csv"))
+    if plot:
+        show_plot(top_journals.sort_values(), "barh", (8, 5), "coral", "Top Journals")
+    return journal_summary
+
+
+def top_authors(df, outdir, topn=20, plot=True):
+    if "Authors" not in df.columns:
+        print("No 'Authors' column found in CSV.")
+        return None
 
-if "Authors" in df.columns:
     author_list = (
         df["Authors"]
         .dropna()
@@ -56,7 +81,7 @@ if "Authors" in df.columns:
 
     author_list = author_list[author_list.str.len() > 2]
 
-    top_authors = author_list.value_counts().head(20)
+    top_authors = author_list.value_counts().head(topn)
     print("\nTop Authors (Full Names):\n", top_authors)
 
     try:
@@ -66,19 +91,22 @@ if "Authors" in df.columns:
         top_authors.to_csv(backup_path, header=["Count"])
         print(f"Saved backup as {backup_path}")
 
-    top_authors.sort_values().plot(kind="barh", figsize=(8, 6), color="lightgreen", title="Top Authors")
-    plt.tight_layout()
-    plt.show()
-else:
-    print("No 'Authors' column found in CSV.")
+    if plot:
+        show_plot(top_authors.sort_values(), "barh", (8, 6), "lightgreen", "Top Authors")
+    return top_authors
+
+
+def top_institutions(df, outdir, topn=15, plot=True):
+    inst_col = None
+    for c in df.columns:
+        if "affiliation" in c.lower() or "institution" in c.lower():
+            inst_col = c
+            break
 
-inst_col = None
-for c in df.columns:
-    if "affiliation" in c.lower() or "institution" in c.lower():
-        inst_col = c
-        break
+    if not inst_col:
+        print("No institution/affiliation column found.")
+        return None
 
-if inst_col:
     inst_list = (
         df[inst_col]
         .dropna()
@@ -88,30 +116,44 @@ if inst_col:
         .str.strip()
     )
     inst_list = inst_list[inst_list.str.len() > 2]
-    top_institutions = inst_list.value_counts().head(15)
+    top_institutions = inst_list.value_counts().head(topn)
     print("\nTop Institutions:\n", top_institutions)
 
     top_institutions.to_csv(os.path.join(outdir, "top_institutions.csv"), header=["Count"])
-    top_institutions.sort_values().plot(kind="barh", figsize=(8, 5), color="orange", title="Top Institutions")
-    plt.tight_layout()
-    plt.show()
-else:
-    print("No institution/affiliation column found.")
+    if plot:
+        show_plot(top_institutions.sort_values(), "barh", (8, 5), "orange", "Top Institutions")
+    return top_institutions
+
+
+def top_countries(df, outdir, topn=15, plot=True):
+    paper_countries = extract_countries(df)
+    top_countries = country_summary(paper_countries, topn=topn)
 
-country_col = None
-for c in df.columns:
-    if "country" in c.lower():
-        country_col = c
-        break
+    if top_countries.empty:
+        print("No countries found in the affiliation columns.")
+        return None
 
-if country_col:
-    top_countries = df[country_col].dropna().value_counts().head(15)
     print("\nTop Countries:\n", top_countries)
-    top_countries.to_csv(os.path.join(outdir, "top_countries.csv"), header=["Count"])
-    top_countries.sort_values().plot(kind="barh", figsize=(8, 5), color="violet", title="Top Countries")
-    plt.tight_layout()
-    plt.show()
-else:
-    print("No country column found in the data.")
+    top_countries.to_csv(os.path.join(outdir, "top_countries.csv"))
+    if plot:
+        show_plot(top_countries["Papers"].sort_values(), "barh", (8, 5), "violet", "Top Countries")
+    return top_countries
+
+
+def main(file_path=FILE_PATH, outdir=OUTDIR, plot=True):
+    os.makedirs(outdir, exist_ok=True)
+
+    df = load_corpus(file_path)
+    print(f"Loaded {file_path} with columns:\n{list(df.columns)}")
+
+    papers_by_year(df, outdir, plot=plot)
+    top_journals(df, outdir, plot=plot)
+    top_authors(df, outdir, plot=plot)
+    top_institutions(df, outdir, plot=plot)
+    top_countries(df, outdir, plot=plot)
+
+    print("\nInteractive analysis complete! All summaries saved to 'analysis_results' folder.\n")
+
 
-print("\nInteractive analysis complete! All summaries saved to 'analysis_results' folder.\n")
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,30 @@
 # File name: organization.py
 import pandas as pd
-import networkx as nx
-import matplotlib.pyplot as plt
 from itertools import combinations
 from collections import Counter
-from networkx.algorithms.community import greedy_modularity_communities
 
 FILE_PATH = "285scopus_wearables_ai_education_corpus.csv"
 AFFILIATION_COLUMN = "Affiliations"
 
-df = pd.read_csv(FILE_PATH)
 
-paper_orgs = []
-org_publication_count = Counter()
+def collect_paper_organizations(df):
+    paper_orgs = []
+    org_publication_count = Counter()
 
-for aff in df[AFFILIATION_COLUMN].dropna():
-    orgs = [o.strip() for o in aff.split(";") if len(o.strip()) > 3]
-    unique_orgs = list(set(orgs))
+    for aff in df[AFFILIATION_COLUMN].dropna():
+        orgs = [o.strip() for o in aff.split(";") if len(o.strip()) > 3]
+        unique_orgs = list(set(orgs))
 
-    paper_orgs.append(unique_orgs)
+        paper_orgs.append(unique_orgs)
 
-    for org in unique_orgs:
-        org_publication_count[org] += 1
+        for org in unique_orgs:
+            org_publication_count[org] += 1
 
-print(f"Total unique organizations: {len(org_publication_count)}")
+    return paper_orgs, org_publication_count
 
-def build_and_plot_org_network(min_pubs):
-    print(f"\n=== Organization Network | Min publications ≥ {min_pubs} ===")
+
+def build_org_graph(paper_orgs, org_publication_count, min_pubs):
+    import networkx as nx
 
     valid_orgs = {o for o, c in org_publication_count.items() if c >= min_pubs}
 
@@ -44,6 +42,18 @@ def build_and_plot_org_network(min_pubs):
             else:
                 G.add_edge(o1, o2, weight=1)
 
+    return G
+
+
+def build_and_plot_org_network(paper_orgs, org_publication_count, min_pubs):
+    import matplotlib.pyplot as plt
+    import networkx as nx
+    from networkx.algorithms.community import greedy_modularity_communities
+
+    print(f"\n=== Organization Network | Min publications ≥ {min_pubs} ===")
+
+    G = build_org_graph(paper_orgs, org_publication_count, min_pubs)
+
     print(f"Organizations in graph: {G.number_of_nodes()}")
     print(f"Collaborations (edges): {G.number_of_edges()}")
 
@@ -112,5 +122,16 @@ def build_and_plot_org_network(min_pubs):
     plt.axis("off")
     plt.show()
 
-for min_pub in [1, 2, 3]:
-    build_and_plot_org_network(min_pub)
+
+def main(file_path=FILE_PATH, min_pubs_levels=(1, 2, 3)):
+    df = pd.read_csv(file_path)
+    paper_orgs, org_publication_count = collect_paper_organizations(df)
+
+    print(f"Total unique organizations: {len(org_publication_count)}")
+
+    for min_pub in min_pubs_levels:
+        build_and_plot_org_network(paper_orgs, org_publication_count, min_pub)
+
+
+if __name__ == "__main__":
+    main()
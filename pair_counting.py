@@ -0,0 +1,28 @@
+# File name: pair_counting.py
+import pandas as pd
+
+
+def count_pairs(groups, min_weight=1):
+    """Count unordered co-occurring pairs across a Series of per-paper lists.
+
+    Each paper contributes at most once to a pair, and pairs are returned with
+    the alphabetically smaller item first, sorted by descending weight.
+    """
+    items = groups.reset_index(drop=True).explode().dropna()
+    frame = (
+        pd.DataFrame({"paper": items.index, "item": items.astype(str).to_numpy()})
+        .drop_duplicates()
+    )
+
+    pairs = frame.merge(frame, on="paper", suffixes=("_1", "_2"))
+    pairs = pairs[pairs["item_1"] < pairs["item_2"]]
+
+    counts = (
+        pairs.groupby(["item_1", "item_2"])
+        .size()
+        .reset_index(name="weight")
+    )
+    counts = counts[counts["weight"] >= min_weight]
+    return counts.sort_values(
+        ["weight", "item_1", "item_2"], ascending=[False, True, True]
+    ).reset_index(drop=True)
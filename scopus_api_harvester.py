@@ -0,0 +1,450 @@
+# File name: scopus_api_harvester.py
+import argparse
+import asyncio
+import csv
+import io
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from tqdm import tqdm
+
+DEFAULT_BASE_URL = "https://api.elsevier.com"
+SEARCH_PATH = "/content/search/scopus"
+ABSTRACT_PATH = "/content/abstract/eid/{eid}"
+
+CORPUS_COLUMNS = [
+    "Authors", "Author full names", "Author(s) ID", "Title", "Year", "Source title",
+    "Volume", "Issue", "Art. No.", "Page start", "Page end", "Cited by", "DOI", "Link",
+    "Affiliations", "Authors with affiliations", "Abstract", "Author Keywords",
+    "Index Keywords", "Molecular Sequence Numbers", "Chemicals/CAS", "Tradenames",
+    "Manufacturers", "Funding Details", "Funding Texts", "References",
+    "Correspondence Address", "Editors", "Publisher", "Sponsors", "Conference name",
+    "Conference date", "Conference location", "Conference code", "ISSN", "ISBN", "CODEN",
+    "PubMed ID", "Language of Original Document", "Abbreviated Source Title",
+    "Document Type", "Publication Stage", "Open Access", "Source", "EID",
+]
+
+
+class TokenBucket:
+    """Async token bucket allowing `rate` requests per second per API key.
+
+    The bucket holds at least one token, so rates below one request per second
+    still let a request through.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = max(1.0, capacity or rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def retry_delay(retry_after, attempt):
+    """Seconds to wait before a retry.
+
+    `Retry-After` may be a number of seconds or an HTTP date; anything else
+    falls back to exponential backoff.
+    """
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            pass
+        else:
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=timezone.utc)
+            return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    return 2 ** attempt
+
+
+class ScopusClient:
+    """Pooled Scopus API client; requests run on a worker pool of `concurrency` threads."""
+
+    def __init__(self, api_keys, base_url=DEFAULT_BASE_URL, rate=9, concurrency=8,
+                 max_retries=5, timeout=30):
+        if not api_keys:
+            raise ValueError("At least one Scopus API key is required.")
+        self.base_url = base_url.rstrip("/")
+        self.buckets = [(key, TokenBucket(rate)) for key in api_keys]
+        self.next_key = 0
+        self.max_retries = max_retries
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        self.session.close()
+
+    async def get_json(self, path, params=None):
+        """GET a JSON payload, retrying 429/5xx, dropped connections, timeouts and bad JSON."""
+        loop = asyncio.get_running_loop()
+        for attempt in range(self.max_retries + 1):
+            key, bucket = self.buckets[self.next_key]
+            self.next_key = (self.next_key + 1) % len(self.buckets)
+            await bucket.acquire()
+
+            last_attempt = attempt == self.max_retries
+            try:
+                response = await loop.run_in_executor(self.executor, lambda: self.session.get(
+                    self.base_url + path,
+                    params=params,
+                    headers={"X-ELS-APIKey": key, "Accept": "application/json"},
+                    timeout=self.timeout,
+                ))
+            except (requests.ConnectionError, requests.Timeout):
+                if last_attempt:
+                    raise
+                await asyncio.sleep(2 ** attempt)
+                continue
+
+            if response.status_code == 429 or response.status_code >= 500:
+                if last_attempt:
+                    response.raise_for_status()
+                await asyncio.sleep(retry_delay(response.headers.get("Retry-After"), attempt))
+                continue
+            response.raise_for_status()
+            try:
+                return response.json()
+            except ValueError:
+                if last_attempt:
+                    raise
+                await asyncio.sleep(2 ** attempt)
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _text(value):
+    return value.get("$", "") if isinstance(value, dict) else (value or "")
+
+
+def entry_to_record(entry, abstract=None):
+    """Map a Search API entry (COMPLETE view) onto the Scopus CSV export columns."""
+    record = dict.fromkeys(CORPUS_COLUMNS, "")
+
+    affiliations = {
+        a.get("afid"): ", ".join(
+            p for p in (a.get("affilname"), a.get("affiliation-city"), a.get("affiliation-country")) if p
+        )
+        for a in _as_list(entry.get("affiliation"))
+    }
+    authors = _as_list(entry.get("author"))
+    record["Authors"] = "; ".join(f"{a.get('surname', '')}, {a.get('initials', '')}" for a in authors)
+    record["Author full names"] = "; ".join(
+        f"{a.get('surname', '')}, {a.get('given-name', '')} ({a.get('authid', '')})" for a in authors
+    )
+    record["Author(s) ID"] = "; ".join(a.get("authid", "") for a in authors)
+    record["Authors with affiliations"] = "; ".join(
+        ", ".join([f"{a.get('surname', '')}, {a.get('given-name', '')}"] + [
+            affiliations[_text(af)] for af in _as_list(a.get("afid")) if _text(af) in affiliations
+        ])
+        for a in authors
+    )
+    record["Affiliations"] = "; ".join(affiliations.values())
+
+    pages = (entry.get("prism:pageRange") or "").split("-")
+    record.update({
+        "Title": entry.get("dc:title", ""),
+        "Year": (entry.get("prism:coverDate") or "")[:4],
+        "Source title": entry.get("prism:publicationName", ""),
+        "Volume": entry.get("prism:volume", ""),
+        "Issue": entry.get("prism:issueIdentifier", ""),
+        "Art. No.": entry.get("article-number", ""),
+        "Page start": pages[0] if len(pages) == 2 else "",
+        "Page end": pages[1] if len(pages) == 2 else "",
+        "Cited by": entry.get("citedby-count", ""),
+        "DOI": entry.get("prism:doi", ""),
+        "Link": next((l.get("@href", "") for l in _as_list(entry.get("link")) if l.get("@ref") == "scopus"), ""),
+        "Abstract": entry.get("dc:description", ""),
+        "Author Keywords": "; ".join(k.strip() for k in (entry.get("authkeywords") or "").split("|") if k.strip()),
+        "ISSN": entry.get("prism:issn", ""),
+        "ISBN": "; ".join(_text(i) for i in _as_list(entry.get("prism:isbn"))),
+        "PubMed ID": entry.get("pubmed-id", ""),
+        "Document Type": entry.get("subtypeDescription", ""),
+        "Open Access": "All Open Access" if entry.get("openaccessFlag") else "",
+        "Source": "Scopus",
+        "EID": entry.get("eid", ""),
+    })
+
+    if abstract:
+        apply_abstract(record, abstract)
+
+    return record
+
+
+def apply_abstract(record, abstract):
+    """Fill the columns that only the Abstract API provides."""
+    response = abstract.get("abstracts-retrieval-response") or {}
+    idxterms = (response.get("idxterms") or {}).get("mainterm")
+    record["Index Keywords"] = "; ".join(_text(t) for t in _as_list(idxterms))
+    record["Publisher"] = (response.get("coredata") or {}).get("dc:publisher", "")
+
+
+def load_checkpoint(path):
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_checkpoint(path, checkpoint):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def read_written_eids(path):
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return {row["EID"] for row in csv.DictReader(f)}
+
+
+class CorpusWriter:
+    """Appends records to a corpus CSV, skipping EIDs that are already there.
+
+    Each page is written with a single call, so a killed run does not leave a
+    half-written row behind.
+    """
+
+    def __init__(self, path):
+        self.seen = read_written_eids(path)
+        is_new = not os.path.exists(path)
+        self.file = open(path, "a", encoding="utf-8-sig" if is_new else "utf-8", newline="")
+        self.buffer = io.StringIO()
+        self.writer = csv.DictWriter(self.buffer, fieldnames=CORPUS_COLUMNS, quoting=csv.QUOTE_ALL,
+                                     lineterminator="\n")
+        if is_new:
+            self.writer.writeheader()
+            self._flush()
+
+    def _flush(self):
+        self.file.write(self.buffer.getvalue())
+        self.file.flush()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+
+    def write(self, records):
+        written = 0
+        for record in records:
+            if record["EID"] in self.seen:
+                continue
+            self.writer.writerow(record)
+            self.seen.add(record["EID"])
+            written += 1
+        self._flush()
+        return written
+
+    def close(self):
+        self.file.close()
+
+
+async def harvest_query(client, query, writer, checkpoint, checkpoint_path, progress,
+                        abstract_limit, page_size=25, fetch_abstracts=True):
+    state = checkpoint.setdefault(query, {"cursor": "*", "done": False})
+    while not state["done"]:
+        data = await client.get_json(SEARCH_PATH, {
+            "query": query,
+            "cursor": state["cursor"],
+            "count": page_size,
+            "view": "COMPLETE",
+        })
+        results = data.get("search-results", {})
+        entries = [e for e in results.get("entry", []) if "error" not in e and e.get("eid")]
+
+        abstracts = [None] * len(entries)
+        if fetch_abstracts:
+            pending = [e["eid"] for e in entries if e["eid"] not in writer.seen]
+            fetched = await asyncio.gather(*(
+                fetch_abstract(client, eid, abstract_limit) for eid in pending
+            ))
+            by_eid = dict(zip(pending, fetched))
+            abstracts = [by_eid.get(e["eid"]) for e in entries]
+            state.setdefault("abstract_failures", []).extend(
+                eid for eid, abstract in by_eid.items() if abstract is None
+            )
+
+        progress.update(writer.write(entry_to_record(e, a) for e, a in zip(entries, abstracts)))
+
+        next_cursor = (results.get("cursor") or {}).get("@next")
+        state["done"] = not entries or not next_cursor or next_cursor == state["cursor"]
+        state["cursor"] = next_cursor or state["cursor"]
+        save_checkpoint(checkpoint_path, checkpoint)
+
+
+async def fetch_abstract(client, eid, limit):
+    async with limit:
+        # A failed lookup is recorded in the checkpoint and retried later, so
+        # no failure here should abort the harvest.
+        try:
+            return await client.get_json(ABSTRACT_PATH.format(eid=eid), {"view": "FULL"})
+        except Exception:
+            return None
+
+
+def patch_abstracts(path, abstracts):
+    """Rewrite `path`, filling the Abstract API columns of the rows in `abstracts` (EID -> payload)."""
+    tmp_path = path + ".tmp"
+    with open(path, encoding="utf-8-sig", newline="") as f, \
+            open(tmp_path, "w", encoding="utf-8-sig", newline="") as out:
+        writer = csv.DictWriter(out, fieldnames=CORPUS_COLUMNS, quoting=csv.QUOTE_ALL,
+                                lineterminator="\n")
+        writer.writeheader()
+        for row in csv.DictReader(f):
+            if row["EID"] in abstracts:
+                apply_abstract(row, abstracts[row["EID"]])
+            writer.writerow(row)
+    os.replace(tmp_path, path)
+
+
+async def retry_failed_abstracts(client, output_path, checkpoint, checkpoint_path, limit):
+    """Retry the abstract lookups recorded as failed in the checkpoint.
+
+    Recovered records are patched in place; returns how many still failed.
+    """
+    failed = sorted({eid for state in checkpoint.values() for eid in state.get("abstract_failures", [])})
+    if not failed:
+        return 0
+
+    fetched = await asyncio.gather(*(fetch_abstract(client, eid, limit) for eid in failed))
+    recovered = {eid: abstract for eid, abstract in zip(failed, fetched) if abstract is not None}
+    if recovered:
+        patch_abstracts(output_path, recovered)
+
+    for state in checkpoint.values():
+        state["abstract_failures"] = sorted(set(state.get("abstract_failures", [])) - set(recovered))
+    save_checkpoint(checkpoint_path, checkpoint)
+    return len(failed) - len(recovered)
+
+
+def merge_refreshed(output_path, refreshed_path):
+    """Replace `output_path` with the refreshed records plus any old ones not re-harvested."""
+    refreshed_eids = read_written_eids(refreshed_path)
+    tmp_path = output_path + ".tmp"
+
+    with open(tmp_path, "w", encoding="utf-8-sig", newline="") as out:
+        writer = csv.DictWriter(out, fieldnames=CORPUS_COLUMNS, quoting=csv.QUOTE_ALL,
+                                lineterminator="\n")
+        writer.writeheader()
+        with open(refreshed_path, encoding="utf-8-sig", newline="") as f:
+            writer.writerows(csv.DictReader(f))
+        if os.path.exists(output_path):
+            with open(output_path, encoding="utf-8-sig", newline="") as f:
+                writer.writerows(row for row in csv.DictReader(f) if row["EID"] not in refreshed_eids)
+
+    os.replace(tmp_path, output_path)
+    os.replace(refreshed_path + ".checkpoint.json", output_path + ".checkpoint.json")
+    os.remove(refreshed_path)
+    return len(read_written_eids(output_path))
+
+
+async def harvest(queries, output_path, api_keys, base_url=DEFAULT_BASE_URL, rate=9,
+                  concurrency=8, page_size=25, fetch_abstracts=True, refresh=False):
+    """Harvest every query into `output_path`, resuming from `<output_path>.checkpoint.json`.
+
+    With `refresh`, the queries are harvested again from the first page into
+    `<output_path>.refresh.csv` (itself resumable), and on completion those
+    records replace the ones with the same EID in `output_path`, so updated
+    `Cited by` counts are picked up.
+
+    Abstract lookups that fail are kept in the checkpoint and retried at the
+    end of this and every later run, until they succeed.
+    """
+    target_path = output_path + ".refresh.csv" if refresh else output_path
+    checkpoint_path = target_path + ".checkpoint.json"
+    checkpoint = load_checkpoint(checkpoint_path)
+    client = ScopusClient(api_keys, base_url=base_url, rate=rate, concurrency=concurrency)
+    writer = CorpusWriter(target_path)
+    abstract_limit = asyncio.Semaphore(concurrency)
+
+    try:
+        try:
+            with tqdm(desc="Harvested records", unit="rec", initial=len(writer.seen)) as progress:
+                await asyncio.gather(*(
+                    harvest_query(client, query, writer, checkpoint, checkpoint_path, progress,
+                                  abstract_limit, page_size=page_size, fetch_abstracts=fetch_abstracts)
+                    for query in queries
+                ))
+        finally:
+            writer.close()
+        still_failed = await retry_failed_abstracts(client, target_path, checkpoint, checkpoint_path,
+                                                    abstract_limit)
+    finally:
+        client.close()
+
+    if still_failed:
+        print(f"\nAbstract lookup failed for {still_failed} records; their Index Keywords and "
+              "Publisher are blank. Re-run the same command to retry them.")
+
+    if refresh:
+        return merge_refreshed(output_path, target_path)
+    return len(writer.seen)
+
+
+def main(argv=None):
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Harvest Scopus search results into the corpus CSV format.")
+    parser.add_argument("queries", nargs="+", help="Scopus advanced search queries, harvested concurrently")
+    parser.add_argument("--output", default="scopus_api_corpus.csv")
+    parser.add_argument("--base-url", default=os.getenv("SCOPUS_BASE_URL", DEFAULT_BASE_URL))
+    parser.add_argument("--rate", type=float, default=9, help="Requests per second per API key")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--page-size", type=int, default=25)
+    parser.add_argument("--no-abstracts", action="store_true", help="Skip Abstract API lookups")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Re-harvest from the first page and overwrite records already in the output")
+    args = parser.parse_args(argv)
+
+    api_keys = [k.strip() for k in os.getenv("SCOPUS_API_KEYS", os.getenv("SCOPUS_API_KEY", "")).split(",")
+                if k.strip()]
+    if not api_keys:
+        parser.error("Set SCOPUS_API_KEYS (comma-separated) or SCOPUS_API_KEY, e.g. in a .env file.")
+
+    total = asyncio.run(harvest(
+        args.queries,
+        args.output,
+        api_keys,
+        base_url=args.base_url,
+        rate=args.rate,
+        concurrency=args.concurrency,
+        page_size=args.page_size,
+        fetch_abstracts=not args.no_abstracts,
+        refresh=args.refresh,
+    ))
+    print(f"\nSaved {total} records to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
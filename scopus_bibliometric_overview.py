@@ -1,10 +1,12 @@
 # File name: analysis.py
 import pandas as pd
-import matplotlib.pyplot as plt
 import os
 import re
 import itertools
-import networkx as nx
+
+from citation_impact_metrics import build_citation_table, citation_metrics, metrics_for
+
+AUTHOR_ID_COLUMN = "Author(s) ID"
 
 def load_file(filepath):
     for enc in ["utf-8", "latin1"]:
@@ -18,6 +20,8 @@ def load_file(filepath):
 
 
 def papers_by_year(df, outdir):
+    import matplotlib.pyplot as plt
+
     year_cols = [c for c in df.columns if "year" in c.lower()]
     if not year_cols:
         return
@@ -38,6 +42,8 @@ def papers_by_year(df, outdir):
     plt.close()
 
 def top_journals(df, outdir, topn=15):
+    import matplotlib.pyplot as plt
+
     journal_cols = [c for c in df.columns if "journal" in c.lower() or "source title" in c.lower()]
     if not journal_cols:
         return
@@ -55,52 +61,50 @@ def top_journals(df, outdir, topn=15):
     plt.savefig(os.path.join(outdir, "top_journals.png"), dpi=200)
     plt.close()
 
-def top_authors_with_latest_papers(df, outdir, topn=20):
-    author_cols = [c for c in df.columns if "author" in c.lower()]
+def top_authors_with_latest_papers(df, outdir, topn=20, metrics=None):
     year_cols = [c for c in df.columns if "year" in c.lower()]
     title_cols = [c for c in df.columns if "title" in c.lower()]
 
-    if not author_cols or not year_cols or not title_cols:
+    if "Authors" not in df.columns or AUTHOR_ID_COLUMN not in df.columns \
+            or not year_cols or not title_cols:
         print("Missing required columns for author analysis.")
         return
 
-    author_col = author_cols[0]
     year_col = year_cols[0]
     title_col = title_cols[0]
 
-    rows = []
-
-    for _, row in df.iterrows():
-        if pd.isna(row[author_col]):
-            continue
+    author_df = pd.DataFrame({
+        "author": df["Authors"].astype("string").str.split(";"),
+        "author_id": df[AUTHOR_ID_COLUMN].astype("string").str.split(";"),
+        "year": pd.to_numeric(df[year_col], errors="coerce"),
+        "title": df[title_col],
+    }).dropna(subset=["author", "author_id"])
+
+    # Names and IDs are parallel lists; skip records where Scopus truncated one.
+    same_length = author_df["author"].str.len() == author_df["author_id"].str.len()
+    author_df = author_df[same_length].explode(["author", "author_id"])
+    author_df["author"] = author_df["author"].str.strip()
+    author_df["author_id"] = author_df["author_id"].str.strip()
+
+    author_df = author_df.sort_values("year", ascending=False, kind="stable")
+    grouped = author_df.groupby("author_id", sort=False)
+    summary = grouped.agg(
+        Author=("author", "first"),
+        Publications=("title", "size"),
+    ).nlargest(topn, "Publications", keep="first")
+
+    latest = author_df[author_df["author_id"].isin(summary.index)].dropna(subset=["title"])
+    latest = latest.assign(slot=latest.groupby("author_id").cumcount() + 1)
+    latest = latest[latest["slot"] <= 3].pivot(index="author_id", columns="slot", values="title")
+
+    out_df = summary.reset_index().rename(columns={"author_id": "Author ID"})
+    for slot in range(1, 4):
+        titles = latest[slot] if slot in latest.columns else pd.Series(dtype=object)
+        out_df[f"Latest Paper {slot}"] = out_df["Author ID"].map(titles).fillna("")
+
+    author_metrics = metrics_for(metrics, "author")
+    out_df = out_df.join(author_metrics.drop(columns="Papers"), on="Author ID")
 
-        authors = [a.strip() for a in re.split(r"[;,]", str(row[author_col])) if len(a.strip()) > 2]
-        for a in authors:
-            rows.append({
-                "author": a,
-                "year": row[year_col],
-                "title": row[title_col]
-            })
-
-    author_df = pd.DataFrame(rows)
-    author_df["year"] = pd.to_numeric(author_df["year"], errors="coerce")
-
-    top_authors = author_df["author"].value_counts().head(topn).index.tolist()
-
-    output_rows = []
-    for author in top_authors:
-        sub = author_df[author_df["author"] == author].sort_values("year", ascending=False)
-        latest_titles = sub["title"].dropna().head(3).tolist()
-
-        output_rows.append({
-            "Author": author,
-            "Publications": len(sub),
-            "Latest Paper 1": latest_titles[0] if len(latest_titles) > 0 else "",
-            "Latest Paper 2": latest_titles[1] if len(latest_titles) > 1 else "",
-            "Latest Paper 3": latest_titles[2] if len(latest_titles) > 2 else "",
-        })
-
-    out_df = pd.DataFrame(output_rows)
     out_df.to_csv(os.path.join(outdir, "top_authors_with_latest_papers.csv"), index=False)
     print("Saved top_authors_with_latest_papers.csv")
 
@@ -131,6 +135,9 @@ def author_coauthorship_network(df, outdir, min_edges=2):
     edge_df = pd.DataFrame(edges)
     edge_df.to_csv(os.path.join(outdir, "author_coauthorship_edges.csv"), index=False)
 
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     G = nx.Graph()
     for _, row in edge_df.iterrows():
         G.add_edge(row["Author_1"], row["Author_2"], weight=row["Weight"])
@@ -151,17 +158,17 @@ def author_coauthorship_network(df, outdir, min_edges=2):
 
     print("Saved author co-authorship network (CSV + PNG)")
 
-def main():
-    file_path = "285scopus_wearables_ai_education_corpus.csv"
-    outdir = "analysis_results"
+def main(file_path="285scopus_wearables_ai_education_corpus.csv", outdir="analysis_results"):
     os.makedirs(outdir, exist_ok=True)
 
     df = load_file(file_path)
     print(f"Columns detected: {list(df.columns)}")
 
+    metrics = citation_metrics(build_citation_table(df))
+
     papers_by_year(df, outdir)
     top_journals(df, outdir)
-    top_authors_with_latest_papers(df, outdir)
+    top_authors_with_latest_papers(df, outdir, metrics=metrics)
     author_coauthorship_network(df, outdir)
 
     print("\nAnalysis complete. Check 'analysis_results' folder.")
@@ -0,0 +1,162 @@
+# File name: mock_scopus_server.py
+import argparse
+import json
+import threading
+import zlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+def make_entry(query, index, cited_by_bonus=0):
+    eid = f"2-s2.0-{zlib.crc32(query.encode()) % 10 ** 6:06d}{index:05d}"
+    return {
+        "eid": eid,
+        "dc:title": f"{query} paper {index}",
+        "prism:coverDate": f"{2015 + index % 10}-05-01",
+        "prism:publicationName": "Sensors",
+        "prism:pageRange": f"{index}-{index + 9}",
+        "citedby-count": str(index % 7 + cited_by_bonus),
+        "prism:doi": f"10.0000/{eid}",
+        "link": [{"@ref": "scopus", "@href": f"https://www.scopus.com/record/{eid}"}],
+        "affiliation": [
+            {"afid": "1", "affilname": "Univ A", "affiliation-city": "Delhi", "affiliation-country": "India"},
+            {"afid": "2", "affilname": "Univ B", "affiliation-city": "Athens", "affiliation-country": "Greece"},
+        ],
+        "author": [
+            {"authid": "11", "surname": "Doe", "given-name": "Jane", "initials": "J.", "afid": [{"$": "1"}]},
+            {"authid": "22", "surname": "Roe", "given-name": "Rich", "initials": "R.", "afid": [{"$": "2"}]},
+        ],
+        "authkeywords": "wearables | AI",
+        "subtypeDescription": "Article",
+        "openaccessFlag": True,
+    }
+
+
+class MockScopusServer:
+    """Local stand-in for the Scopus Search and Abstract APIs.
+
+    `faults` maps 1-based request numbers to "429", "429-date" (Retry-After
+    given as an HTTP date), "500", "drop" (close the connection without
+    answering) or "bad-json", so tests can inject failures
+    at a known point. Abstract lookups for EIDs in `missing_abstracts` answer
+    404. Served requests are recorded as (path, status) pairs.
+    """
+
+    def __init__(self, records_per_query=60, faults=None, host="127.0.0.1", port=0):
+        self.records_per_query = records_per_query
+        self.faults = dict(faults or {})
+        self.cited_by_bonus = 0
+        self.missing_abstracts = set()
+        self.requests = []
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def statuses(self, path_prefix=""):
+        return [status for path, status in self.requests if path.startswith(path_prefix)]
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def send_json(self, status, payload, headers=None, body=None):
+                body = body if body is not None else json.dumps(payload).encode()
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                with server.lock:
+                    number = len(server.requests) + 1
+                    fault = server.faults.pop(number, None)
+                    status = {"429": 429, "429-date": 429, "500": 500}.get(fault, 0 if fault == "drop" else 200)
+                    if not fault and url.path.rsplit("/", 1)[-1] in server.missing_abstracts:
+                        status = 404
+                    server.requests.append((url.path, status))
+
+                if fault == "drop":
+                    self.close_connection = True
+                    return
+                if fault == "429":
+                    return self.send_json(429, {"error": "rate limited"}, {"Retry-After": "0"})
+                if fault == "429-date":
+                    retry_at = format_datetime(datetime.now(timezone.utc), usegmt=True)
+                    return self.send_json(429, {"error": "rate limited"}, {"Retry-After": retry_at})
+                if fault == "500":
+                    return self.send_json(500, {"error": "server error"})
+                if fault == "bad-json":
+                    return self.send_json(200, None, body=b"{not json")
+                if not self.headers.get("X-ELS-APIKey"):
+                    return self.send_json(401, {"error": "missing API key"})
+
+                params = parse_qs(url.query)
+                if url.path == "/content/search/scopus":
+                    return self.send_json(200, self.search(params))
+                if url.path.startswith("/content/abstract/eid/"):
+                    if url.path.rsplit("/", 1)[-1] in server.missing_abstracts:
+                        return self.send_json(404, {"error": "resource not found"})
+                    return self.send_json(200, {"abstracts-retrieval-response": {
+                        "coredata": {"dc:publisher": "MDPI"},
+                        "idxterms": {"mainterm": [{"$": "Wearable"}, {"$": "Education"}]},
+                    }})
+                self.send_json(404, {"error": "not found"})
+
+            def search(self, params):
+                query = params["query"][0]
+                cursor = params.get("cursor", ["*"])[0]
+                count = int(params.get("count", ["25"])[0])
+                start = 0 if cursor == "*" else int(cursor)
+                stop = min(start + count, server.records_per_query)
+                entries = [make_entry(query, i, server.cited_by_bonus) for i in range(start, stop)]
+                return {"search-results": {
+                    "opensearch:totalResults": str(server.records_per_query),
+                    "cursor": {"@current": cursor, "@next": str(stop)},
+                    "entry": entries or [{"@_fa": "true", "error": "Result set was empty"}],
+                }}
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a mock Scopus API for harvester testing.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--records", type=int, default=230, help="Records returned per query")
+    args = parser.parse_args()
+
+    server = MockScopusServer(records_per_query=args.records, port=args.port)
+    print(f"Mock Scopus API on {server.url} (use --base-url {server.url})")
+    server.httpd.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
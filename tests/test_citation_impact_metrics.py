@@ -0,0 +1,111 @@
+import os
+
+import pandas as pd
+import pytest
+
+from citation_impact_metrics import (
+    TABLE_COLUMNS,
+    build_citation_table,
+    citation_metrics,
+    update_citation_table,
+)
+from conftest import ROOT
+
+CORPUS = os.path.join(ROOT, "285scopus_wearables_ai_education_corpus.csv")
+
+
+def make_table(rows):
+    return pd.DataFrame(rows, columns=TABLE_COLUMNS)
+
+
+def entity_rows(kind, entity, cited, first_year=2020):
+    return [(kind, entity, f"{kind}-{entity}-{i}", c, first_year + i) for i, c in enumerate(cited)]
+
+
+def test_hand_computed_metrics():
+    table = make_table(
+        entity_rows("author", "A", [3, 10, 4, 8, 5])       # h=4, g=5 (capped by paper count)
+        + entity_rows("author", "B", [0, 20, 0, 1, 0, 0])  # h=1, g=4: 21 < 5**2 binds
+        + entity_rows("author", "C", [3, 3, 3, 3])         # ties: h=3, g=3
+        + entity_rows("author", "D", [0, 0])               # all zero
+        + entity_rows("author", "E", [7], first_year=2024)  # one paper
+        + entity_rows("keyword", "A", [1])                 # same name, other kind
+    )
+    metrics = citation_metrics(table, current_year=2024)
+
+    expected = pd.DataFrame(
+        [
+            ("author", "A", 5, 30, 6.0, 4, 5, 6.0),
+            ("author", "B", 6, 21, 3.5, 1, 4, 4.2),
+            ("author", "C", 4, 12, 3.0, 3, 3, 2.4),
+            ("author", "D", 2, 0, 0.0, 0, 0, 0.0),
+            ("author", "E", 1, 7, 7.0, 1, 1, 7.0),
+            ("keyword", "A", 1, 1, 1.0, 1, 1, 0.2),
+        ],
+        columns=["kind", "entity", "Papers", "Total Citations", "Mean Citations",
+                 "h-index", "g-index", "Citations per Year"],
+    ).set_index(["kind", "entity"])
+    pd.testing.assert_frame_equal(metrics, expected, check_dtype=False)
+
+
+def test_empty_table():
+    metrics = citation_metrics(make_table([]))
+    assert metrics.empty
+    assert list(metrics.index.names) == ["kind", "entity"]
+
+
+def brute_force(cited):
+    cited = sorted(cited, reverse=True)
+    h = max([r for r, c in enumerate(cited, start=1) if c >= r], default=0)
+    g = max([r for r in range(1, len(cited) + 1) if sum(cited[:r]) >= r * r], default=0)
+    return len(cited), sum(cited), h, g
+
+
+@pytest.mark.skipif(not os.path.exists(CORPUS), reason="sample corpus not available")
+def test_matches_brute_force_on_the_sample_corpus():
+    table = build_citation_table(pd.read_csv(CORPUS))
+    metrics = citation_metrics(table)
+
+    expected = table.groupby(["kind", "entity"])["cited_by"].apply(
+        lambda s: brute_force(s.astype(int).tolist())
+    )
+    actual = metrics[["Papers", "Total Citations", "h-index", "g-index"]].apply(tuple, axis=1)
+    assert len(actual) == len(expected)
+    assert actual.to_dict() == expected.to_dict()
+
+
+def export(rows):
+    return pd.DataFrame(rows, columns=[
+        "EID", "Cited by", "Year", "Author(s) ID", "Affiliations", "Source title",
+        "Author Keywords", "Index Keywords",
+    ])
+
+
+def test_update_citation_table_matches_a_rebuild_of_the_union(tmp_path):
+    old = export([
+        ("e1", 5, 2020, "1; 2", "Univ A; Univ B", "Sensors", "AI; Wearables", None),
+        ("e2", 1, 2021, "2", "Univ B", "Sensors", "AI", "Education"),
+        ("e3", 0, 2022, "3", None, "Computers", None, None),
+    ])
+    new = export([
+        ("e2", 9, 2021, "2", "Univ B", "Sensors", "AI", "Education"),
+        ("e4", 4, 2023, "1; 3", "Univ A", "Computers", "wearables", None),
+    ])
+    table_path = str(tmp_path / "citation_table.pkl")
+
+    update_citation_table(table_path, old)
+    merged = update_citation_table(table_path, new)
+    union = pd.concat([old[old["EID"] != "e2"], new], ignore_index=True)
+
+    def normalise(table):
+        return table.sort_values(TABLE_COLUMNS).reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(normalise(merged), normalise(build_citation_table(union)),
+                                  check_dtype=False)
+    pd.testing.assert_frame_equal(normalise(pd.read_pickle(table_path)), normalise(merged))
+    assert merged.loc[merged["paper"] == "e2", "cited_by"].eq(9).all()
+
+
+def test_update_citation_table_requires_eids(tmp_path):
+    with pytest.raises(ValueError):
+        update_citation_table(str(tmp_path / "table.pkl"), export([]).drop(columns="EID"))
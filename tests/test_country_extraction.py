@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from country_extraction import (
+    build_matcher,
+    country_collaboration_edges,
+    extract_countries,
+    find_countries,
+    load_gazetteer,
+    top_countries,
+)
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return build_matcher(load_gazetteer())
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("University of Georgia, Athens, GA, United States", {"United States"}),
+    ("Tbilisi State University, Tbilisi, Georgia", {"Georgia"}),
+    ("Abdou Moumouni University, Niamey, Niger", {"Niger"}),
+    ("University of Lagos, Lagos, Nigeria", {"Nigeria"}),
+    ("Univ, Niamey, Niger; Univ, Lagos, Nigeria", {"Niger", "Nigeria"}),
+    ("KAIST, Daejeon, Korea, Republic of", {"South Korea"}),
+    ("Kim Il Sung University, Pyongyang, Democratic People's Republic of Korea", {"North Korea"}),
+    ("Marien Ngouabi University, Brazzaville, Congo", {"Congo"}),
+    ("University of Kinshasa, Kinshasa, Democratic Republic of the Congo", {"Democratic Republic Congo"}),
+    ("University of Kinshasa, Kinshasa, DR Congo", {"Democratic Republic Congo"}),
+    ("Nigerian Institute, Abuja", set()),
+    ("", set()),
+])
+def test_find_countries(matcher, text, expected):
+    assert find_countries(text, matcher) == expected
+
+
+def test_falls_back_to_authors_with_affiliations(matcher):
+    df = pd.DataFrame({
+        "Affiliations": ["Univ A, Delhi, India; Univ B, Athens, Greece", np.nan, np.nan],
+        "Authors with affiliations": [
+            "Doe, J., Univ C, Paris, France",
+            "Roe, R., Univ D, Lagos, Nigeria; Poe, P., Univ E, Rome, Italy",
+            np.nan,
+        ],
+    })
+    assert extract_countries(df, matcher).tolist() == [["Greece", "India"], ["Italy", "Nigeria"], []]
+
+
+def test_empty_frame(matcher):
+    paper_countries = extract_countries(pd.DataFrame(columns=["Affiliations"]), matcher)
+
+    summary = top_countries(paper_countries)
+    assert summary.empty
+    assert list(summary.columns) == ["Papers", "International Papers"]
+
+    edges = country_collaboration_edges(paper_countries)
+    assert edges.empty
+    assert list(edges.columns) == ["Country_1", "Country_2", "Weight"]
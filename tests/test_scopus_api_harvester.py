@@ -0,0 +1,162 @@
+import asyncio
+import csv
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import scopus_api_harvester as harvester
+from conftest import ROOT
+from mock_scopus_server import MockScopusServer, make_entry
+
+
+def read_rows(path):
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def run_harvest(server, output, **kwargs):
+    kwargs.setdefault("rate", 200)
+    kwargs.setdefault("page_size", 5)
+    return asyncio.run(harvester.harvest(["wearables"], str(output), ["test-key"],
+                                         base_url=server.url, **kwargs))
+
+
+def test_bucket_below_one_request_per_second_grants_the_first_token():
+    bucket = harvester.TokenBucket(0.5)
+    asyncio.run(asyncio.wait_for(bucket.acquire(), timeout=1))
+    assert bucket.capacity == 1.0
+
+
+def test_harvests_at_a_fractional_rate(tmp_path):
+    output = tmp_path / "corpus.csv"
+    with MockScopusServer(records_per_query=3) as server:
+        start = time.monotonic()
+        total = run_harvest(server, output, rate=0.5, fetch_abstracts=False)
+
+    assert total == 3
+    assert 1.5 < time.monotonic() - start < 10  # two pages, one token every 2 s
+
+
+def test_harvests_every_cursor_page_and_retries_429(tmp_path):
+    output = tmp_path / "corpus.csv"
+    with MockScopusServer(records_per_query=23, faults={2: "429"}) as server:
+        total = run_harvest(server, output)
+
+    rows = read_rows(output)
+    assert total == 23
+    assert len({row["EID"] for row in rows}) == 23
+    assert list(rows[0].keys()) == harvester.CORPUS_COLUMNS
+    assert 429 in server.statuses()
+    assert server.statuses("/content/search/scopus").count(200) == 6  # 5 pages + empty page
+    assert rows[0]["Index Keywords"] == "Wearable; Education"
+    assert rows[0]["Affiliations"] == "Univ A, Delhi, India; Univ B, Athens, Greece"
+
+
+def test_retry_after_accepts_seconds_and_http_dates():
+    assert harvester.retry_delay("3", attempt=0) == 3
+    assert harvester.retry_delay("Wed, 21 Oct 2015 07:28:00 GMT", attempt=0) == 0
+    assert 50 < harvester.retry_delay(format_datetime(
+        datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True), attempt=0) <= 60
+    assert harvester.retry_delay("soon", attempt=2) == 4
+    assert harvester.retry_delay(None, attempt=3) == 8
+
+
+def test_retries_429_with_an_http_date_retry_after(tmp_path):
+    output = tmp_path / "corpus.csv"
+    with MockScopusServer(records_per_query=7, faults={1: "429-date"}) as server:
+        total = run_harvest(server, output, fetch_abstracts=False)
+
+    assert total == 7
+    assert server.statuses()[0] == 429
+
+
+def test_retries_dropped_connections_and_bad_json(tmp_path):
+    output = tmp_path / "corpus.csv"
+    with MockScopusServer(records_per_query=12, faults={1: "drop", 3: "bad-json", 4: "500"}) as server:
+        total = run_harvest(server, output)
+
+    assert total == 12
+    assert len(read_rows(output)) == 12
+
+
+def test_failed_abstracts_are_retried_on_the_next_run(tmp_path, capsys):
+    output = tmp_path / "corpus.csv"
+    checkpoint_path = str(output) + ".checkpoint.json"
+    with MockScopusServer(records_per_query=8) as server:
+        missing = {make_entry("wearables", 2)["eid"], make_entry("wearables", 6)["eid"]}
+        server.missing_abstracts = set(missing)
+        assert run_harvest(server, output) == 8
+
+        rows = {row["EID"]: row for row in read_rows(output)}
+        assert {eid for eid, row in rows.items() if not row["Index Keywords"]} == missing
+        with open(checkpoint_path, encoding="utf-8") as f:
+            assert set(json.load(f)["wearables"]["abstract_failures"]) == missing
+        assert "Abstract lookup failed for 2 records" in capsys.readouterr().out
+
+        server.missing_abstracts.clear()
+        searches = len(server.statuses("/content/search/scopus"))
+        assert run_harvest(server, output) == 8
+        assert len(server.statuses("/content/search/scopus")) == searches
+
+    rows = read_rows(output)
+    assert len(rows) == 8
+    assert all(row["Index Keywords"] == "Wearable; Education" for row in rows)
+    assert all(row["Publisher"] == "MDPI" for row in rows)
+    with open(checkpoint_path, encoding="utf-8") as f:
+        assert json.load(f)["wearables"]["abstract_failures"] == []
+    assert "Abstract lookup failed" not in capsys.readouterr().out
+
+
+def test_resume_after_kill_writes_no_duplicates(tmp_path):
+    output = tmp_path / "corpus.csv"
+    env = dict(os.environ, SCOPUS_API_KEYS="test-key")
+
+    with MockScopusServer(records_per_query=60) as server:
+        proc = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "scopus_api_harvester.py"), "wearables",
+             "--output", str(output), "--base-url", server.url, "--rate", "5",
+             "--page-size", "5", "--no-abstracts"],
+            cwd=tmp_path, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if output.exists() and len(read_rows(output)) >= 15:
+                break
+            time.sleep(0.05)
+        proc.kill()
+        proc.wait()
+
+        partial = read_rows(output)
+        assert 15 <= len(partial) < 60
+
+        total = run_harvest(server, output, fetch_abstracts=False)
+
+    eids = [row["EID"] for row in read_rows(output)]
+    assert total == 60
+    assert len(eids) == len(set(eids)) == 60
+    with open(str(output) + ".checkpoint.json", encoding="utf-8") as f:
+        assert json.load(f)["wearables"]["done"]
+
+
+def test_finished_harvest_is_not_requeried_until_refresh(tmp_path):
+    output = tmp_path / "corpus.csv"
+    with MockScopusServer(records_per_query=10) as server:
+        run_harvest(server, output, fetch_abstracts=False)
+        served = len(server.requests)
+
+        run_harvest(server, output, fetch_abstracts=False)
+        assert len(server.requests) == served
+
+        server.cited_by_bonus = 100
+        server.records_per_query = 12
+        total = run_harvest(server, output, fetch_abstracts=False, refresh=True)
+
+    rows = read_rows(output)
+    assert total == 12
+    assert len({row["EID"] for row in rows}) == 12
+    assert all(int(row["Cited by"]) >= 100 for row in rows)
+    assert not os.path.exists(str(output) + ".refresh.csv")